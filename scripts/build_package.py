@@ -1,12 +1,41 @@
 #!/usr/bin/env py
+import argparse
 import json
+import logging
 import os
 import re
+import sys
 import zipfile
 
 zip_suffix = 'zip'
 
+logger = logging.getLogger('build_package')
+
+
+def _walk(top, skip=('.git',)):
+    """Yield (DirEntry, relpath) for every file below top, skipping dirs named in skip.
+
+    relpath is '/'-separated on every platform, ready to use as a zip member name.
+    """
+    stack = [(top, '')]
+    while stack:
+        path, rel = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip:
+                        stack.append((entry.path, rel + entry.name + '/'))
+                elif entry.is_file():
+                    yield entry, rel + entry.name
+
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the mod zip from the current directory.")
+    parser.add_argument('-v', '--verbose', action='store_true', help="list every file added to the zip")
+    args = parser.parse_args()
+    logging.basicConfig(stream=sys.stdout, format='%(message)s',
+                        level=logging.DEBUG if args.verbose else logging.INFO)
+
     with open("info.json") as fin:
         info_json = json.load(fin)
         version = info_json['version']
@@ -14,18 +43,18 @@ if __name__ == '__main__':
 
     version_name = zip_prefix + "_" + version
     zipname = version_name + '.' + zip_suffix
-    print("Building %s" % zipname)
+    logger.info("Building %s", zipname)
+    archive_re = re.compile(zip_prefix + '.*' + zip_suffix)
+    added = 0
     with zipfile.ZipFile(zipname, 'w', zipfile.ZIP_DEFLATED) as zout:
-        for root, dirs, files in os.walk('.'):
-            if '.git' in dirs:
-                dirs.remove('.git')
-            for f in files:
-                if re.match(zip_prefix + '.*' + zip_suffix, f):
-                    continue
-                if f.endswith("~"):
-                    continue
-                fullname = os.path.join(root, f)
-                newname = os.path.normpath(os.path.join(version_name, root, f))
-                print("%s -> %s" % (fullname, newname))
-                zout.write(fullname, arcname=newname)
-
+        for entry, relname in _walk('.'):
+            f = entry.name
+            if archive_re.match(f):
+                continue
+            if f.endswith("~"):
+                continue
+            newname = version_name + '/' + relname
+            zout.write(entry.path, arcname=newname)
+            logger.debug("%s -> %s", entry.path, newname)
+            added += 1
+    logger.info("Added %d files", added)
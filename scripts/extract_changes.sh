@@ -3,6 +3,5 @@
 #
 # ignore first 3 lines and match until line starts with ----, remove said line, remove two spaces at start of all lines,
 #  add linebreak in front of line if it starts with a non-space but ignore the first line
-sed -n -e '4,/^----/p' changelog.txt | sed -e '/^----/d' | sed 's/^\s\s//g' | sed -E '2,$s/^(\S)/\n\1/g' > changes.txt 
-
-cat changes.txt
+# (all in a single sed pass; line 5 of changelog.txt is the second line of output), then write and echo it via tee
+sed -n -E '4,/^----/{/^----/d;s/^\s\s//;5,$s/^(\S)/\n\1/;p}' changelog.txt | tee changes.txt